@@ -1,35 +1,106 @@
 from __future__ import annotations   #To use type hints as strings for cleaner code
-from dataclasses import dataclass   #To create simple classes for storing data
-from typing import Dict, Generic, Iterator, Optional, TypeVar   #Importing necessary types for type hinting
+from typing import Any, Generic, Iterable, Iterator, List, Optional, TypeVar   #Importing necessary types for type hinting
 from node import Node   #Import our node module
 
 T = TypeVar("T")   #creates a placeholder type variable T for generics
 
-@dataclass(frozen=True)
-class Position(Generic[T]):
-    """
-    This class is an immutable reference to a node(Not an index) that enables O(1) all 3 operations:
-    get(i), insert, and remove.
-    """
-    node: Node[T]
+#A Position is the node itself: a reference to a node (Not an index) that enables O(1) all 3 operations:
+#get(i), insert, and remove. Returning the node directly avoids allocating a wrapper object on every call.
+Position = Node
+
+_INVALID_POS = "Invalid/foreign Position (node not in this list)."   #Shared error message for every validation site
 
 class FastSLL(Generic[T]):
     """
-    This class is a singly linked list that supports the insert, remove, and get(i) operations in O(1).
-    Uses predecessor map to achieve O(1) removal without doubly linking.
-    prev[id(node)] = node's predecessor (or None if head)
+    This class is a circular doubly linked list (a ring with a sentinel node) that supports the insert, remove,
+    and get(i) operations in O(1).
+    Each node carries its own predecessor pointer (node.prev) to achieve O(1) removal,
+    so no separate predecessor map has to be hashed on every operation.
+    Every live node is tagged with this list's _owner token; a position is valid only if its tag matches,
+    which rejects foreign/stale positions with one attribute load and identity compare (no hashing).
+
+    The nodes hang off a permanent sentinel node in a ring: sentinel.next is the head, sentinel.prev is the tail,
+    tail.next and head.prev point back at the sentinel. Every node therefore always has a real predecessor and
+    successor, so insert/remove never branch on "is this the head/tail/an empty list".
+
+    pool_size > 0 keeps up to that many removed nodes on a free-list and reuses them for later inserts,
+    avoiding allocator churn on insert/remove cycles. It is off by default because a recycled node means a
+    stale position can no longer be told apart from the new element reusing its node.
     """
 
+    #Fixed attribute slots: no per-instance __dict__, so every self._sentinel/self._size access is a slot load.
+    __slots__ = ("_sentinel", "_owner", "_size", "_pool", "_pool_size")
+
     #Constructor that runs when list is created.
-    def __init__(self) -> None:
-        self.head: Optional[Node[T]] = None  #Starts with no first node
-        self.tail: Optional[Node[T]] = None  #Starts with no last node
+    def __init__(self, pool_size: int = 0) -> None:
+        self._sentinel: Node[T] = Node(None)  #Never tagged with _owner, so it can't be used as a position
+        self._sentinel.next = self._sentinel.prev = self._sentinel  #Empty ring: sentinel links to itself
 
-        self.prev: Dict[int, Optional[Node[T]]] = {}  # maps node_id -> predecessor node
+        self._owner: object = object()  #Unique token stamped on every node in this list
         self._size: int = 0  #Tracks how many nodes are in the list
+
+        self._pool: List[Node[T]] = []  #Removed nodes waiting to be reused
+        self._pool_size: int = pool_size  #Max nodes kept in the pool (0 disables recycling)
     
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> FastSLL[T]:
+        """Function to build a list from an iterable in bulk (see extend_from_iterable)."""
+        sll: FastSLL[T] = cls()
+        sll.extend_from_iterable(values)
+        return sll
+
+    def extend_from_iterable(self, values: Iterable[T]) -> List[Position[T]]:
+        """
+        Function to append every value of an iterable in bulk and return their positions in order,
+        instead of paying a full append() call per element.
+        """
+        return self._splice(self._sentinel.prev, values)  #Splice after the current tail (sentinel if empty)
+
+    def splice_after(self, pos: Position[T], values: Iterable[T]) -> List[Position[T]]:
+        """
+        Function to insert every value of an iterable after the given position in one pass, keeping their order,
+        and return their positions. Same result as chaining insert_after calls, without a full call per element.
+        """
+        if pos._owner is not self._owner:
+            raise ValueError(_INVALID_POS)
+        return self._splice(pos, values)
+
+    def _splice(self, pred: Node[T], values: Iterable[T]) -> List[Node[T]]:
+        """
+        Function to link new nodes for all values between pred and its successor.
+        All nodes are created in one comprehension and chained in a single pass; the outer links are fixed once.
+        """
+        nodes = [Node(v) for v in values]
+        if not nodes:
+            return nodes
+
+        owner = self._owner
+        succ = pred.next  #Sentinel if pred is the tail
+        for node in nodes:  #Chain every node both ways onto the previous one
+            node.prev = pred
+            node._owner = owner
+            pred.next = node
+            pred = node
+
+        pred.next = succ  #Reconnect the last new node to the rest of the ring
+        succ.prev = pred
+        self._size += len(nodes)
+        return nodes
+
     # Basic helpers
 
+    @property
+    def head(self) -> Optional[Node[T]]:
+        """First node, or None if list is empty."""
+        first = self._sentinel.next
+        return None if first is self._sentinel else first
+
+    @property
+    def tail(self) -> Optional[Node[T]]:
+        """Last node, or None if list is empty."""
+        last = self._sentinel.prev
+        return None if last is self._sentinel else last
+
     def __len__(self) -> int:
         """Function to get length of list."""
         return self._size
@@ -40,136 +111,167 @@ class FastSLL(Generic[T]):
 
     def first(self) -> Optional[Position[T]]:
         """Function to get first position in list."""
-        return Position(self.head) if self.head else None
+        return self.head
 
     def last(self) -> Optional[Position[T]]:
         """Function to get last position in list."""
-        return Position(self.tail) if self.tail else None
+        return self.tail
 
     def value_iterator(self) -> Iterator[T]:
         """Function to go through the list of nodes and yields the data in each node."""
-        cur = self.head
-        while cur is not None:
+        sentinel = self._sentinel
+        cur = sentinel.next
+        while cur is not sentinel:
             yield cur.data  #Yield is used to create a generator to produce values 1 at a time as well as for memory efficiency + O(n)
             cur = cur.next
 
-    def _validate(self, pos: Position[T]) -> Node[T]:
+    def to_list(self) -> List[T]:
+        """
+        Function to copy all values into a new Python list in one tight loop.
+        Faster than list(value_iterator()) as it skips the generator resume per element and fills a pre-sized list.
         """
-        Safety function to ensure position is valid for the list and returns the actual node.
-        This is necessary to prevent corruption of the list by foreign positions.
-        """    
-        node = pos.node
-        if id(node) not in self.prev:
-            raise ValueError("Invalid/foreign Position (node not in this list).")
-        return node
+        size = self._size
+        out: List[Any] = [None] * size
+        cur = self._sentinel.next
+        for i in range(size):  #Size is known, so a for-range loop replaces the per-node sentinel compare
+            out[i] = cur.data
+            cur = cur.next
+        return out
 
     # Core ADT operations
+    # Every method taking a position first checks that the node belongs to this list.
+    # This is necessary to prevent corruption of the list by foreign/stale positions, and is
+    # written inline (rather than through a helper) to save a Python call frame per operation.
     
     def get(self, pos: Position[T]) -> T:
         """Function to validate node position and return its value."""
-        node = self._validate(pos)
-        return node.data
+        if pos._owner is not self._owner:
+            raise ValueError(_INVALID_POS)
+        return pos.data
 
     def append(self, value: T) -> Position[T]:
-        """Function to add new node at tail of list."""
-        new_node = Node(value)
-
-        if self.head is None:
-            self.head = self.tail = new_node
-            self.prev[id(new_node)] = None
+        """Function to add new node at tail of list (between the old tail and the sentinel)."""
+        sentinel = self._sentinel  #Local lookups are cheaper than repeated self.<attr> loads
+        last = sentinel.prev
+        pool = self._pool  #Reuse a pooled node if any (inline: no extra call frame per insert)
+        if pool:
+            new_node = pool.pop()
+            new_node.data = value
+            new_node.next = sentinel
         else:
-            assert self.tail is not None
-            self.prev[id(new_node)] = self.tail
-            self.tail.next = new_node
-            self.tail = new_node
+            new_node = Node(value, sentinel)
+        new_node._owner = self._owner
+        new_node.prev = last
+        last.next = new_node
+        sentinel.prev = new_node
 
         self._size += 1
-        return Position(new_node)
+        return new_node
 
     def prepend(self, value: T) -> Position[T]:
-        """Function to add new node at head of list."""
-        new_node = Node(value, next=self.head)
-
-        if self.head is None:
-            self.head = self.tail = new_node
-            self.prev[id(new_node)] = None
+        """Function to add new node at head of list (between the sentinel and the old head)."""
+        sentinel = self._sentinel
+        first = sentinel.next
+        pool = self._pool  #Reuse a pooled node if any (inline: no extra call frame per insert)
+        if pool:
+            new_node = pool.pop()
+            new_node.data = value
+            new_node.next = first
         else:
-            old_head = self.head
-            self.head = new_node
-            self.prev[id(new_node)] = None
-            self.prev[id(old_head)] = new_node
+            new_node = Node(value, first)
+        new_node._owner = self._owner
+        new_node.prev = sentinel
+        first.prev = new_node
+        sentinel.next = new_node
 
         self._size += 1
-        return Position(new_node)
+        return new_node
 
     def insert_after(self, pos: Position[T], value: T) -> Position[T]:
         """Function to insert a new node after the node referenced by the given position."""
-        cur = self._validate(pos)
-        new_node = Node(value, next=cur.next)
-        cur.next = new_node
-
-        self.prev[id(new_node)] = cur
-
-        if new_node.next is not None:  #If there is a node after current node, update predecessor to be new_node not cur anymore
-            self.prev[id(new_node.next)] = new_node
+        if pos._owner is not self._owner:
+            raise ValueError(_INVALID_POS)
+        cur = pos
+        nxt = cur.next  #Sentinel if cur is the tail
+        pool = self._pool  #Reuse a pooled node if any (inline: no extra call frame per insert)
+        if pool:
+            new_node = pool.pop()
+            new_node.data = value
+            new_node.next = nxt
         else:
-            self.tail = new_node
+            new_node = Node(value, nxt)
+        new_node._owner = self._owner
+        new_node.prev = cur
+        cur.next = new_node
+        nxt.prev = new_node
 
         self._size += 1
-        return Position(new_node)
+        return new_node
 
     def insert_before(self, pos: Position[T], value: T) -> Position[T]:
-        """Function to insert before given position. O(1) via predecessor map."""
-        target = self._validate(pos)
-        pred = self.prev[id(target)]  
-
-        #If no predecessor, target will be head, so can proceeed to call prepend straightaway.
-        if pred is None:
-            return self.prepend(value)
-
-        new_node = Node(value, next=target)
+        """Function to insert before given position. O(1) via the target's predecessor pointer."""
+        if pos._owner is not self._owner:
+            raise ValueError(_INVALID_POS)
+        target = pos
+        pred = target.prev  #Sentinel if target is the head
+        pool = self._pool  #Reuse a pooled node if any (inline: no extra call frame per insert)
+        if pool:
+            new_node = pool.pop()
+            new_node.data = value
+            new_node.next = target
+        else:
+            new_node = Node(value, target)
+        new_node._owner = self._owner
+        new_node.prev = pred
         pred.next = new_node
+        target.prev = new_node
 
-        #Updating prev map
-        self.prev[id(new_node)] = pred
-        self.prev[id(target)] = new_node
         self._size += 1
-
-        return Position(new_node)
+        return new_node
 
     def remove(self, pos: Position[T]) -> T:
         """Function to remove and return element at position in O(1)."""
-        target = self._validate(pos)
-        pred = self.prev[id(target)]  #find predecessor
-        nxt = target.next  #Find next node
-
-        if pred is None:   # Removing head when there is no predecessor
-            self.head = nxt
-            if nxt is not None:  #If there is a next node, update its predecessor to None
-                self.prev[id(nxt)] = None
-            else:  # List is now empty
-                self.tail = None
-        else:  # Removing from middle or tail when predecessor exists
-            pred.next = nxt
-            if nxt is not None:
-                self.prev[id(nxt)] = pred
-            else:
-                self.tail = pred
-        
-        del self.prev[id(target)] 
+        target = pos
+        if target._owner is not self._owner:
+            raise ValueError(_INVALID_POS)
+        pred = target.prev  #find predecessor (sentinel if head)
+        nxt = target.next  #Find next node (sentinel if tail)
+        pred.next = nxt
+        nxt.prev = pred
+
         self._size -= 1
         target.next = None
-        return target.data
+        target.prev = None
+        target._owner = None  #Positions to this node are stale from now on
+        data = target.data
+
+        if self._pool_size:  #Pooling enabled: recycle node (dropping its data reference) if pool has room
+            pool = self._pool
+            if len(pool) < self._pool_size:
+                target.data = None
+                pool.append(target)
+        return data
 
     def clear(self) -> None:
-        """Function to clear head and tail pointers and prev map in O(1) (No traversal)."""
-        self.head = None
-        self.tail = None
-        self.prev.clear()
+        """
+        Function to clear the list in O(n): unlink every node, then reset the sentinel ring.
+        Breaking the next/prev cycles lets reference counting free the nodes immediately (no cyclic-GC pass needed),
+        and clearing each _owner tag makes all old positions stale.
+        """
+        sentinel = self._sentinel
+        cur = sentinel.next
+        while cur is not sentinel:
+            nxt = cur.next
+            cur.next = None
+            cur.prev = None
+            cur._owner = None
+            cur = nxt
+        sentinel.next = sentinel.prev = sentinel
         self._size = 0
 
     def next(self, pos: Position[T]) -> Optional[Position[T]]:
         """Function to return the position of node after the given position."""
-        node = self._validate(pos)
-        nxt = node.next
-        return Position(nxt) if nxt else None  #Return None if no next node (At end of list)
\ No newline at end of file
+        if pos._owner is not self._owner:
+            raise ValueError(_INVALID_POS)
+        nxt = pos.next
+        return None if nxt is self._sentinel else nxt  #None if no next node (At end of list)
@@ -5,12 +5,16 @@ T = TypeVar("T")
 
 class Node(Generic[T]):
     """
-    Singly linked list node.
-    Stores one data item and a pointer to the next node.
+    Node of a circular doubly linked list (a ring closed by a sentinel node).
+    Stores one data item, a pointer to the next node and a back-pointer to its predecessor
+    so the list can unlink it in O(1) without a separate lookup table.
+    _owner is the owner token of the list currently holding the node (None if it is in no list).
     """
-    __slots__ = ("data", "next")
+    __slots__ = ("data", "next", "prev", "_owner")
 
     def __init__(self, data: T, next: Optional["Node[T]"] = None) -> None:
         self.data = data
         self.next = next
+        self.prev: Optional["Node[T]"] = None
+        self._owner: Optional[object] = None
 
@@ -1,61 +1,177 @@
 from __future__ import annotations
 
+import argparse
+import cProfile
+import gc
+import itertools
+import os
+import pstats
+import statistics
 import time
-from typing import Any, List, Tuple
+import timeit
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Tuple, TypeVar
 
+import fast_sll
 from fast_sll import FastSLL, Position
+from node import Node
 
+R = TypeVar("R")
+TimingBatch = Callable[[FastSLL[int], Position[int], int], int]
 
-class CountingDict(dict):
-    """Counts dict operations."""
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.ops = 0
 
-    def reset(self) -> None:
-        self.ops = 0
+class CountingNode(Node):
+    """Node that ticks a shared counter on every field write (data/next/prev/_owner)."""
+    __slots__ = ()
+    ticks = itertools.count()  #next() on it is a single C-level increment
 
-    def __getitem__(self, k):
-        self.ops += 1
-        return super().__getitem__(k)
+    def __setattr__(self, name: str, value: Any) -> None:
+        next(CountingNode.ticks)
+        object.__setattr__(self, name, value)
 
-    def __setitem__(self, k, v):
-        self.ops += 1
-        return super().__setitem__(k, v)
 
-    def __delitem__(self, k):
-        self.ops += 1
-        return super().__delitem__(k)
+@contextmanager
+def counting_nodes() -> Iterator[None]:
+    """Makes FastSLL allocate CountingNode (sentinel included) inside the with-block."""
+    fast_sll.Node = CountingNode
+    try:
+        yield
+    finally:
+        fast_sll.Node = Node
 
-    def __contains__(self, k):
-        self.ops += 1
-        return super().__contains__(k)
 
+def count_node_writes(op: Callable[[], R]) -> Tuple[int, R]:
+    """Runs op() and returns how many node fields it wrote, along with its result."""
+    ticks = CountingNode.ticks
+    start = next(ticks)
+    result = op()
+    return next(ticks) - start - 1, result
 
-def attach_counting_prev(sll: FastSLL[Any]) -> CountingDict:
-    cd = CountingDict(sll.prev)
-    sll.prev = cd
-    return cd
 
-
-def build_list(n: int) -> Tuple[FastSLL[int], List[Position[int]]]:
+def build_list(n: int) -> Tuple[FastSLL[int], Position[int]]:
+    """Builds [0, n) in bulk and returns it together with the position of the middle node."""
     sll = FastSLL[int]()
-    pos: List[Position[int]] = []
-    for i in range(n):
-        pos.append(sll.append(i))
-    return sll, pos
-
-
-def fmt_us(x: float) -> str:
-    return f"{x:8.3f}"
-
-
-def main() -> None:
+    pos = sll.extend_from_iterable(range(n))
+    return sll, pos[n // 2]
+
+
+def fmt_us(x: float, spread: float) -> str:
+    return f"{x:7.3f} ±{spread:6.3f}"
+
+
+# Part B timing batches. Each runs `reps` operations on the list and returns the elapsed
+# nanoseconds of the timed part only; any setup/cleanup around it is untimed and leaves
+# the list as it found it, so a batch can be repeated on the same list.
+
+def time_get(sll: FastSLL[int], mid: Position[int], reps: int) -> int:
+    # get() is so cheap that the Python for-loop would dominate, so let timeit run it in its own tight loop
+    get_timer = timeit.Timer("sll.get(mid)", timer=time.perf_counter_ns, globals={"sll": sll, "mid": mid})
+    return get_timer.timeit(reps)
+
+
+def time_prepend(sll: FastSLL[int], mid: Position[int], reps: int) -> int:
+    prepended: List[Position[int]] = []
+    t0 = time.perf_counter_ns()
+    for _ in itertools.repeat(None, reps):
+        prepended.append(sll.prepend(-1))
+    t1 = time.perf_counter_ns()
+
+    for p in prepended:
+        sll.remove(p)
+    return t1 - t0
+
+
+def time_insert_after(sll: FastSLL[int], mid: Position[int], reps: int) -> int:
+    inserted: List[Position[int]] = []
+    t0 = time.perf_counter_ns()
+    for _ in itertools.repeat(None, reps):
+        inserted.append(sll.insert_after(mid, -1))
+    t1 = time.perf_counter_ns()
+
+    for p in inserted:
+        sll.remove(p)
+    return t1 - t0
+
+
+def time_insert_before(sll: FastSLL[int], mid: Position[int], reps: int) -> int:
+    inserted: List[Position[int]] = []
+    t0 = time.perf_counter_ns()
+    for _ in itertools.repeat(None, reps):
+        inserted.append(sll.insert_before(mid, -1))
+    t1 = time.perf_counter_ns()
+
+    for p in inserted:
+        sll.remove(p)
+    return t1 - t0
+
+
+def time_remove(sll: FastSLL[int], mid: Position[int], reps: int) -> int:
+    inserted: List[Position[int]] = []
+    for _ in itertools.repeat(None, reps):
+        inserted.append(sll.insert_before(mid, -1))
+
+    t0 = time.perf_counter_ns()
+    for p in inserted:
+        sll.remove(p)
+    t1 = time.perf_counter_ns()
+    return t1 - t0
+
+
+def time_splice_after(sll: FastSLL[int], mid: Position[int], reps: int) -> int:
+    # One bulk call for all reps elements: shows the best achievable per-element insert cost, not a per-call cost
+    t0 = time.perf_counter_ns()
+    inserted = sll.splice_after(mid, itertools.repeat(-1, reps))
+    t1 = time.perf_counter_ns()
+
+    for p in inserted:
+        sll.remove(p)
+    return t1 - t0
+
+
+def measure(batch: TimingBatch, sll: FastSLL[int], mid: Position[int], reps: int, runs: int) -> Tuple[float, float]:
+    """
+    Runs a timing batch `runs` times with the garbage collector off; returns median and IQR of μs/op.
+    A short untimed batch runs first so caches and branch predictors are warm for the first sample.
+    """
+    samples: List[float] = []
+    gcold = gc.isenabled()  #Restore the caller's GC state afterwards, as timeit does
+    gc.disable()
+    try:
+        batch(sll, mid, min(1_000, reps))  #warm-up, result discarded
+        for _ in range(runs):
+            samples.append(batch(sll, mid, reps) / 1e3 / reps)
+    finally:
+        if gcold:
+            gc.enable()
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    return statistics.median(samples), q3 - q1
+
+
+@contextmanager
+def pinned_to_one_cpu() -> Iterator[str]:
+    """
+    Pins this process to a single CPU (Linux only) inside the with-block so timings don't migrate between cores;
+    yields a note and restores the original affinity on exit.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        yield "CPU pinning not supported on this platform"
+        return
+    saved = os.sched_getaffinity(0)
+    cpu = min(saved)
+    os.sched_setaffinity(0, {cpu})
+    try:
+        yield f"pinned to CPU {cpu}"
+    finally:
+        os.sched_setaffinity(0, saved)
+
+
+def main(bulk: bool = False) -> None:
     sizes_ops = [10, 1_000, 100_000, 300_000]
     sizes_time = [1_000, 10_000, 100_000, 300_000]
 
     reps_get = 200_000
     reps_upd = 50_000
+    runs = 7
 
     print("\n==============================")
     print(" FastSLL O(1) Evidence")
@@ -63,7 +179,7 @@ def main() -> None:
     print("==============================")
 
     # Part A: Operation counts
-    print("\n[A] Operation-count evidence (prev dict ops per single call)")
+    print("\n[A] Operation-count evidence (node field writes per single call)")
     print("    If O(1), counts should stay constant as n grows.\n")
 
     header = f"{'n':>10} | {'get':>4} | {'prepend':>7} | {'ins_aft':>7} | {'ins_bef':>7} | {'remove':>6}"
@@ -71,89 +187,67 @@ def main() -> None:
     print("-" * len(header))
 
     for n in sizes_ops:
-        sll, pos = build_list(n)
-        cd = attach_counting_prev(sll)
-        mid = pos[n // 2]
-
-        cd.reset()
-        sll.get(mid)
-        ops_get = cd.ops
-
-        cd.reset()
-        p_prepend = sll.prepend(-1)
-        ops_prepend = cd.ops
-
-        cd.reset()
-        p_ins_aft = sll.insert_after(mid, -2)
-        ops_ins_aft = cd.ops
+        with counting_nodes():
+            sll, mid = build_list(n)
 
-        cd.reset()
-        p_ins_bef = sll.insert_before(mid, -3)
-        ops_ins_bef = cd.ops
+            ops_get, _ = count_node_writes(lambda: sll.get(mid))
+            ops_prepend, p_prepend = count_node_writes(lambda: sll.prepend(-1))
+            ops_ins_aft, p_ins_aft = count_node_writes(lambda: sll.insert_after(mid, -2))
+            ops_ins_bef, p_ins_bef = count_node_writes(lambda: sll.insert_before(mid, -3))
+            ops_remove, _ = count_node_writes(lambda: sll.remove(p_ins_aft))
 
-        cd.reset()
-        sll.remove(p_ins_aft)
-        ops_remove = cd.ops
-
-        sll.remove(p_ins_bef)
-        sll.remove(p_prepend)
+            sll.remove(p_ins_bef)
+            sll.remove(p_prepend)
 
         print(f"{n:10d} | {ops_get:4d} | {ops_prepend:7d} | {ops_ins_aft:7d} | {ops_ins_bef:7d} | {ops_remove:6d}")
 
     # Part B: Timing
-    print("\n[B] Timing evidence (average microseconds per operation)")
+    print("\n[B] Timing evidence (microseconds per operation, median ± IQR)")
     print("    If O(1), μs/op should stay roughly flat as n grows.\n")
-    print(f"Repetitions: get={reps_get}, others={reps_upd}\n")
-
-    header = f"{'n':>10} | {'get μs':>7} | {'prepend μs':>10} | {'ins_aft μs':>10} | {'ins_bef μs':>10} | {'remove μs':>9}"
-    print(header)
-    print("-" * len(header))
-
-    for n in sizes_time:
-        sll, pos = build_list(n)
-        mid = pos[n // 2]
-
-        t0 = time.perf_counter()
-        for _ in range(reps_get):
-            sll.get(mid)
-        t1 = time.perf_counter()
-        get_us = (t1 - t0) * 1e6 / reps_get
-
-        prepended: List[Position[int]] = []
-        t0 = time.perf_counter()
-        for k in range(reps_upd):
-            prepended.append(sll.prepend(-k))
-        t1 = time.perf_counter()
-        prepend_us = (t1 - t0) * 1e6 / reps_upd
+    print(f"Repetitions: get={reps_get}, others={reps_upd}; {runs} runs per cell after a warm-up, GC disabled while timing")
+    with pinned_to_one_cpu() as pin_note:
+        print(f"{pin_note}\n")
 
-        for p in prepended:
-            sll.remove(p)
+        header = (f"{'n':>10} | {'get μs':>15} | {'prepend μs':>15} | {'ins_aft μs':>15} | "
+                  f"{'ins_bef μs':>15} | {'remove μs':>15}")
+        batches: List[TimingBatch] = [time_prepend, time_insert_after, time_insert_before, time_remove]
+        if bulk:
+            header += f" | {'splice μs':>15}"
+            batches.append(time_splice_after)
+            print("splice = splice_after(mid, reps values) in one call, reported per element\n")
+        print(header)
+        print("-" * len(header))
 
-        ins_aft_positions: List[Position[int]] = []
-        t0 = time.perf_counter()
-        for k in range(reps_upd):
-            ins_aft_positions.append(sll.insert_after(mid, -k))
-        t1 = time.perf_counter()
-        ins_aft_us = (t1 - t0) * 1e6 / reps_upd
+        for n in sizes_time:
+            sll, mid = build_list(n)
 
-        for p in ins_aft_positions:
-            sll.remove(p)
+            cells = [measure(time_get, sll, mid, reps_get, runs)]
+            for batch in batches:
+                cells.append(measure(batch, sll, mid, reps_upd, runs))
 
-        ins_bef_positions: List[Position[int]] = []
-        t0 = time.perf_counter()
-        for k in range(reps_upd):
-            ins_bef_positions.append(sll.insert_before(mid, -k))
-        t1 = time.perf_counter()
-        ins_bef_us = (t1 - t0) * 1e6 / reps_upd
+            print(f"{n:10d} | " + " | ".join(fmt_us(med, iqr) for med, iqr in cells))
 
-        t0 = time.perf_counter()
-        for p in ins_bef_positions:
-            sll.remove(p)
-        t1 = time.perf_counter()
-        rem_us = (t1 - t0) * 1e6 / reps_upd
 
-        print(f"{n:10d} | {fmt_us(get_us)} | {fmt_us(prepend_us)} | {fmt_us(ins_aft_us)} | {fmt_us(ins_bef_us)} | {fmt_us(rem_us)}")
+def profile_main(bulk: bool = False, top: int = 25) -> None:
+    """Runs main() under cProfile and prints the functions with the most own time."""
+    profiler = cProfile.Profile()
+    profiler.runcall(main, bulk)
+    pstats.Stats(profiler).sort_stats(pstats.SortKey.TIME).print_stats(top)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Operation-count and timing evidence that FastSLL operations are O(1).")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="run under cProfile and print the hottest functions (timings in the tables are inflated by the profiler); "
+             "for import cost use `python -X importtime prove_o1_evidence.py`",
+    )
+    parser.add_argument(
+        "--bulk", action="store_true",
+        help="add a Part B column timing splice_after() bulk insertion (per element) next to the per-call columns",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profile_main(args.bulk)
+    else:
+        main(args.bulk)
\ No newline at end of file